@@ -8,6 +8,7 @@ import re
 import sys
 
 from regex import Regex
+from textbuffer import TextBuffer
 
 __version__ = '0.1.0'
 _PROGRAM = os.path.basename(sys.argv[0])
@@ -137,8 +138,10 @@ class Editor():
         if not expressions:
             expressions = self.default_expressions
         regexes = self._get_regexes(expressions)
+        buffer = TextBuffer(self._text)
         for regex in regexes:
-            self._text = regex.apply(self._text)
+            regex.edit(buffer)
+        self._text = buffer.text
 
     def _get_regexes(self, expressions: list[str]):
         """Create a list of Regex objects based on the list of regular expressions."""
@@ -1,6 +1,32 @@
 """Regex class -- Interpret and apply a regular expression."""
 
 import re
+from typing import Optional
+
+try:
+    from re import _constants as sre_constants
+    from re._parser import parse
+except ImportError:  # Python < 3.11
+    import sre_constants  # pylint: disable=deprecated-module
+    from sre_parse import parse  # pylint: disable=deprecated-module
+
+from textbuffer import TextBuffer
+
+# The opcodes are created at run time by the constants module, so pylint cannot see them.
+# pylint: disable=no-member
+_AT = sre_constants.AT
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+_BRANCH = sre_constants.BRANCH
+_GROUPREF = sre_constants.GROUPREF
+_GROUPREF_EXISTS = sre_constants.GROUPREF_EXISTS
+_MAXREPEAT = sre_constants.MAXREPEAT
+_SUBPATTERN = sre_constants.SUBPATTERN
+_SINGLE_CHARACTERS = (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY,
+                      sre_constants.IN)
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+            getattr(sre_constants, 'POSSESSIVE_REPEAT', None))
+_ASSERTIONS = (sre_constants.ASSERT, sre_constants.ASSERT_NOT)
+# pylint: enable=no-member
 
 
 class Regex():
@@ -18,6 +44,21 @@ class Regex():
         """Returns True if the object contains a valid regular expression."""
         return self.pattern is not None
 
+    @property
+    def reach(self) -> Optional[tuple[int, int]]:
+        """Get how many characters before and after a match start the pattern can inspect.
+
+        Returns None if the pattern is not valid or can inspect an unlimited number of characters.
+        """
+        if not self.is_valid:
+            return None
+        reach = _Reach()
+        try:
+            reach.walk(parse(self.pattern, self.flags), 0)
+        except _UnlimitedReach:
+            return None
+        return reach.behind + 1, reach.ahead + 1
+
     def apply(self, text) -> str:
         """Convert the text using the regular expression."""
         if not self.is_valid:
@@ -26,6 +67,16 @@ class Regex():
             return self._apply_search(text)
         return self._apply_substitution(text)
 
+    def edit(self, buffer: TextBuffer):
+        """Convert the buffer's text in place using the regular expression.
+
+        A single substitution splices only the matched region into the buffer.
+        """
+        if self.replacement is not None and self.count == 1:
+            buffer.substitute(re.compile(self.pattern, self.flags), self.replacement, self.reach)
+        else:
+            buffer.text = self.apply(buffer.text)
+
     def _apply_search(self, text) -> str:
         if self.count:
             if found := re.search(self.pattern, text, self.flags):
@@ -94,3 +145,82 @@ class Regex():
             self.flags |= re.MULTILINE
         if 's' in flags_text:
             self.flags |= re.DOTALL
+
+
+class _Reach():  # pylint: disable=too-few-public-methods
+    """Measure how far from a match start a parsed pattern can inspect the text.
+
+    The measurement is gathered across recursive calls of `walk`, so it is held as state here.
+    """
+
+    def __init__(self):
+        self.ahead = 0
+        self.behind = 0
+        self._groups = {}
+        self._lookbehind = 0
+
+    def walk(self, subpattern, start) -> int:
+        """Return the furthest offset where the subpattern can end if it starts at `start`."""
+        end = start
+        for op, av in subpattern:
+            end = self._walk_item(op, av, end)
+            self.ahead = max(self.ahead, end)
+        return end
+
+    def _walk_item(self, op, av, start) -> int:
+        """Return the furthest offset where a single parsed item can end."""
+        # pylint: disable=too-many-return-statements
+        if op in _SINGLE_CHARACTERS:
+            return start + 1
+        if op is _AT:
+            # Anchors check the previous character and whether the next one ends the text.
+            self.behind = max(self.behind, self._lookbehind + 1)
+            self.ahead = max(self.ahead, start + 2)
+            return start
+        if op is _SUBPATTERN:
+            group, *_, item = av
+            end = self.walk(item, start)
+            if group is not None:
+                self._groups[group] = end - start
+            return end
+        if op is _ATOMIC_GROUP:
+            return self.walk(av, start)
+        if op is _BRANCH:
+            return max(self.walk(item, start) for item in av[1])
+        if op in _REPEATS:
+            return self._walk_repeat(av, start)
+        if op in _ASSERTIONS:
+            return self._walk_assertion(av, start)
+        if op is _GROUPREF and av in self._groups:
+            return start + self._groups[av]
+        if op is _GROUPREF_EXISTS:
+            _, yes, no = av
+            return max(self.walk(yes, start), self.walk(no, start) if no else start)
+        raise _UnlimitedReach
+
+    def _walk_repeat(self, av, start) -> int:
+        """Return the furthest offset where a repeated item can end."""
+        _, most, item = av
+        width = self.walk(item, start) - start
+        if width == 0 or most == 0:
+            return start
+        if most == _MAXREPEAT:
+            raise _UnlimitedReach
+        return self.walk(item, start + (most - 1) * width)
+
+    def _walk_assertion(self, av, start) -> int:
+        """Measure a lookahead or lookbehind assertion, which does not move the position."""
+        direction, item = av
+        if direction > 0:
+            self.walk(item, start)
+            return start
+        width = item.getwidth()[1]
+        self._lookbehind += width
+        self.behind = max(self.behind, self._lookbehind)
+        self.walk(item, start - width)
+        self._lookbehind -= width
+        return start
+
+
+class _UnlimitedReach(Exception):
+    """The pattern can inspect an unlimited number of characters."""
@@ -0,0 +1,109 @@
+"""TextBuffer class -- Hold text as a piece table for localized edits."""
+
+from bisect import bisect_right
+from itertools import accumulate
+import re
+from typing import Optional
+
+
+class TextBuffer():
+    """Hold text as a piece table so that localized edits do not copy the whole text.
+
+    Each piece is a (source, start, end) reference to a slice of a source string. The pieces are
+    only joined into a single string when the whole text is requested.
+    """
+
+    def __init__(self, text=''):
+        self._pieces = []
+        self._offsets = []
+        self.text = text
+
+    def __len__(self):
+        if self._pieces:
+            _, start, end = self._pieces[-1]
+            return self._offsets[-1] + end - start
+        return 0
+
+    @property
+    def text(self) -> str:
+        """Get the text, flattening the pieces into a single string."""
+        if len(self._pieces) == 1:
+            source, start, end = self._pieces[0]
+            if start == 0 and end == len(source):
+                return source
+        text = ''.join(source[start:end] for source, start, end in self._pieces)
+        self.text = text
+        return text
+
+    @text.setter
+    def text(self, text: str):
+        """Replace the whole text."""
+        self._set_pieces([(text, 0, len(text))] if text else [])
+
+    def substitute(self, pattern: re.Pattern, replacement: str, reach: Optional[tuple[int, int]]):
+        """Replace the first match of the pattern, splicing only the matched region.
+
+        If the reach is (behind, ahead), the pattern must not inspect more than `behind` characters
+        before a match start nor more than `ahead` characters from it, so that every piece can be
+        searched where it lies. If the reach is None, the text is flattened before the search.
+        """
+        if reach is None:
+            match = pattern.search(self.text)
+            found = (0, match) if match else None
+        else:
+            found = self._search(pattern, *reach)
+        if found:
+            offset, match = found
+            self._splice(offset + match.start(), offset + match.end(), match.expand(replacement))
+
+    def _search(self, pattern, behind, ahead):
+        """Return the (offset, match) of the first match in the text, or None."""
+        checked = 0
+        for (source, start, end), offset in zip(self._pieces, self._offsets):
+            length = end - start
+            if behind < length - ahead:
+                if found := self._search_window(pattern, checked, offset + behind, behind, ahead):
+                    return found
+                # The whole context of a match starting here lies within this piece.
+                match = pattern.search(source, start + behind, end)
+                if match and match.start() < end - ahead:
+                    return offset - start, match
+                checked = offset + length - ahead
+        return self._search_window(pattern, checked, len(self) + 1, behind, ahead)
+
+    def _search_window(self, pattern, first, stop, behind, ahead):
+        """Search for a match starting from `first` up to `stop` in a copy of just that region."""
+        if first >= stop:
+            return None
+        begin = max(first - behind, 0)
+        window = ''.join(source[start:end]
+                         for source, start, end in self._pieces_between(begin, stop + ahead))
+        if (match := pattern.search(window, first - begin)) and begin + match.start() < stop:
+            return begin, match
+        return None
+
+    def _splice(self, begin, stop, text):
+        """Replace the text from `begin` up to `stop` with the specified text."""
+        pieces = self._pieces_between(0, begin)
+        if text:
+            pieces.append((text, 0, len(text)))
+        pieces.extend(self._pieces_between(stop, len(self)))
+        self._set_pieces(pieces)
+
+    def _set_pieces(self, pieces):
+        """Set the pieces and the offset of each piece within the text."""
+        self._pieces = pieces
+        self._offsets = list(accumulate((end - start for _, start, end in pieces[:-1]), initial=0))
+
+    def _pieces_between(self, begin, stop) -> list:
+        """Get the pieces that cover the text from `begin` up to `stop`."""
+        pieces = []
+        index = max(bisect_right(self._offsets, begin) - 1, 0)
+        for (source, start, end), offset in zip(self._pieces[index:], self._offsets[index:]):
+            if offset >= stop:
+                break
+            low = max(begin - offset, 0)
+            high = min(stop - offset, end - start)
+            if low < high:
+                pieces.append((source, start + low, start + high))
+        return pieces
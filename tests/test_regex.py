@@ -7,6 +7,8 @@ from runapp import RunApp
 import testfile
 
 import editor
+from regex import Regex
+from textbuffer import TextBuffer
 
 INFILE = 'tests/files/infile.txt'
 OUTFILE = 'tests/files/outfile.txt'
@@ -264,3 +266,62 @@ class Test3RegexConfigFile():
         assert app.stdout == 'C:/Program Files/nodejs/node_modules/npm/bin/npm.cmd'
         assert app.stderr == ''
         assert app.returncode == 0
+
+
+class Test4SingleReplacement():
+    """Unit tests for single-replacement rules spliced into a text buffer."""
+
+    @staticmethod
+    def test_chain_of_single_replacements(app: RunApp):
+        app.input = TEST_TEXT
+        app.run('-r', 's/saw/SAW/', 's/saw/SEE/', 's/^(\\w+)/<$1>/m', 's/s$/S/', 's/\\bs/Z/')
+        assert app.stdout_lines == [
+            '<Five> frantic frogs fled from fifty fierce fishes.',
+            'If Stu chews Zhoes, should Stu choose the shoes he chews?',
+            'I SAW a SEE that could out saw any saw I ever saw saw.'
+        ]
+        assert app.stderr == ''
+        assert app.returncode == 0
+
+    @staticmethod
+    def test_splices_match_substitution():
+        expressions = [
+            's/saw/X/', 's/\\b(saw)\\b/$1$1/', 's/^I/i/', 's/^I/i/m', 's/s$/Z/',
+            's/(?<=a )\\w{1,3}/Y/',
+            's/(\\w)\\1/$1/', 's/(?=o)o\\w{0,4}/O/', 's/$/!/', 's/\\B//', 's/X X/x/', 's/.{3}/../s',
+        ]
+        buffer = TextBuffer(TEST_TEXT * 3)
+        text = TEST_TEXT * 3
+        for _ in range(8):
+            for expression in expressions:
+                regex = Regex(expression)
+                assert regex.reach is not None
+                regex.edit(buffer)
+                text = re.sub(regex.pattern, regex.replacement, text, 1, regex.flags)
+        assert buffer.text == text
+
+    @staticmethod
+    def test_reach_bounds():
+        assert Regex('s/(?<=ab)c/X/').reach == (3, 2)
+        assert Regex('s/^I/i/m').reach == (2, 3)
+        assert Regex('s/s$/Z/').reach == (2, 4)
+        assert Regex('s/(\\w)\\1/$1/').reach == (1, 3)
+        assert Regex('s/a{2,5}/X/').reach == (1, 6)
+
+    @staticmethod
+    def test_splices_keep_source():
+        source = TEST_TEXT * 3
+        buffer = TextBuffer(source)
+        for expression in ('s/saw/X/', 's/^I/i/m', 's/\\bs/Z/'):
+            Regex(expression).edit(buffer)
+        # pylint: disable-next=protected-access
+        assert all(piece is source for piece, _, _ in buffer._pieces if len(piece) > 3)
+        assert len(buffer._pieces) > 1  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_unlimited_reach():
+        assert Regex('s/\\w+/X/').reach is None
+        assert Regex('s/a.*b/X/').reach is None
+        buffer = TextBuffer(TEST_TEXT)
+        Regex('s/\\w+ /X/').edit(buffer)
+        assert buffer.text == 'X' + TEST_TEXT[5:]